@@ -0,0 +1 @@
+"""Curate Quran recitation videos into a YouTube playlist."""
@@ -0,0 +1,3 @@
+from qpa.cli import main
+
+main()
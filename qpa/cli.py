@@ -0,0 +1,322 @@
+import argparse
+import os
+import random
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from googleapiclient.errors import HttpError
+
+from qpa.core import (
+    ADD_MAX_CANDIDATES_TO_CHECK,
+    AR_KEYWORDS,
+    MAX_TOTAL_ATTEMPTS,
+    RECITERS,
+    RUN_MAX_CANDIDATES_TO_CHECK,
+    SURAH_TOPICS,
+    TOPICS,
+    VIDEOS_PER_RUN,
+    add_video_to_playlist,
+    add_videos_to_playlist,
+    fetch_video_details,
+    get_channel_title,
+    get_existing_video_ids,
+    is_good_video,
+    iso8601_to_seconds,
+    load_query_stats,
+    load_youtube,
+    remember_added_video,
+    save_query_stats,
+    search_videos,
+    search_videos_batch,
+    snippet_is_good,
+    videos_already_in_playlist,
+)
+
+
+# =========================
+# Inserts shared by both commands
+# =========================
+
+def _insert_error_kind(e: HttpError) -> Optional[str]:
+    """Classify the insert errors the commands handle; None for anything else."""
+    msg = str(e)
+    if "videoNotFound" in msg or "Video not found" in msg:
+        return "videoNotFound"
+    if "quotaExceeded" in msg or "Quota exceeded" in msg:
+        return "quotaExceeded"
+    return None
+
+
+def insert_videos(
+    yt: Any, playlist_id: str, video_ids: List[str]
+) -> Dict[str, Optional[HttpError]]:
+    """Insert videos in one batched request; return each one's HttpError (None if added).
+
+    Failures other than videoNotFound / quotaExceeded are retried once on their
+    own, since concurrent inserts into one playlist can conflict. An insert
+    isn't idempotent and a failed one may still have landed, so the live
+    playlist is checked first and only the videos still missing are retried.
+    """
+    errors = add_videos_to_playlist(yt, playlist_id, video_ids)
+    failed = [
+        vid for vid in video_ids
+        if errors.get(vid) is not None and _insert_error_kind(errors[vid]) is None
+    ]
+    if failed:
+        for video_id in videos_already_in_playlist(yt, playlist_id, failed):
+            errors[video_id] = None
+            failed.remove(video_id)
+    for video_id in failed:
+        try:
+            add_video_to_playlist(yt, playlist_id, video_id)
+            errors[video_id] = None
+        except HttpError as retry_error:
+            errors[video_id] = retry_error
+    return errors
+
+
+# =========================
+# add: one reciter + surah search, add the best matches
+# =========================
+
+def build_topic_query() -> str:
+    """Pick a topic with a reciter, and optionally an Arabic keyword."""
+    q = f"{random.choice(RECITERS)} {random.choice(SURAH_TOPICS)}"
+    if random.random() < 0.5:
+        q = f"{q} {random.choice(AR_KEYWORDS)}"
+    return q
+
+
+def add_command(yt: Any, playlist_id: str, max_videos: int, strict: bool) -> None:
+    existing = get_existing_video_ids(yt, playlist_id)
+
+    # Filter every search hit on its snippet up front, so only plausible
+    # candidates cost a videos.list lookup.
+    titles = {
+        vid: title
+        for vid, title, channel_title in search_videos(yt, build_topic_query())
+        if vid not in existing and snippet_is_good(title, channel_title, strict)
+    }
+    candidates = list(titles)
+    random.shuffle(candidates)
+    candidates = candidates[:ADD_MAX_CANDIDATES_TO_CHECK]
+
+    details = fetch_video_details(yt, candidates)
+    picks = [vid for vid in candidates if vid in details and is_good_video(details[vid])]
+
+    added = 0
+    while picks and added < max_videos:
+        queued, picks = picks[:max_videos - added], picks[max_videos - added:]
+
+        # The ID set may be days old: confirm against the live playlist
+        for vid in videos_already_in_playlist(yt, playlist_id, queued):
+            remember_added_video(playlist_id, vid)
+            queued.remove(vid)
+
+        errors = insert_videos(yt, playlist_id, queued) if queued else {}
+        for vid in queued:
+            e = errors.get(vid)
+            if e is None:
+                remember_added_video(playlist_id, vid)
+                print(f"✅ Added to playlist: {vid} | {titles[vid]}")
+                added += 1
+            elif _insert_error_kind(e) == "videoNotFound":
+                print(f"⚠️ Skipping (videoNotFound): {vid}")
+            else:
+                raise e
+
+    if not added:
+        print("⚠️ No suitable video found today (filtered/duplicates/short duration).")
+
+
+# =========================
+# run: daily reciter x topic searches until the target is reached
+# =========================
+
+def build_query_plan(stats: Dict[str, List[int]]) -> Iterator[str]:
+    """Yield every reciter x topic query once (no repeated 100-unit searches).
+
+    Weighted shuffle: each query gets the key u ** (1 / w), largest first, with
+    w = (hits + 1) / (tries + 2) from past runs, so productive combos tend to
+    come early while untried ones still get their turn.
+    """
+    def key(query: str) -> float:
+        hits, tries = stats.get(query, (0, 0))
+        return random.random() ** ((tries + 2) / (hits + 1))
+
+    plan = [f"{reciter} {topic}" for reciter in RECITERS for topic in TOPICS]
+    plan.sort(key=key, reverse=True)
+    return iter(plan)
+
+
+def pick_new_videos(
+    yt: Any,
+    queries: List[str],
+    existing: Set[str],
+    picked_this_run: Set[str],
+    strict: bool,
+) -> List[Tuple[str, str, int, str]]:
+    """Return (video_id, title, minutes, query_used) for at most one new video per query.
+
+    All searches go out in one batched request, and every shortlisted
+    candidate shares one videos.list lookup.
+    """
+    search_videos_batch(yt, queries)  # fills the per-run search cache
+
+    shortlists: List[Tuple[str, List[Tuple[str, str]]]] = []
+    for query in queries:
+        candidates = search_videos(yt, query)
+        random.shuffle(candidates)
+        # Cheap filters first; videos.list only sees the survivors
+        shortlists.append((query, [
+            (vid, title)
+            for vid, title, channel_title in candidates[:RUN_MAX_CANDIDATES_TO_CHECK]
+            if vid not in existing
+            and vid not in picked_this_run
+            and snippet_is_good(title, channel_title, strict)
+        ]))
+    details = fetch_video_details(
+        yt, list(dict.fromkeys(vid for _, shortlist in shortlists for vid, _ in shortlist))
+    )
+
+    picks: List[Tuple[str, str, int, str]] = []
+    taken: Set[str] = set()
+    for query, shortlist in shortlists:
+        for vid, title in shortlist:
+            video = details.get(vid)
+            if vid in taken or not video or not is_good_video(video):
+                continue
+
+            mins = (iso8601_to_seconds(video["contentDetails"]["duration"]) + 30) // 60
+            picks.append((vid, title, mins, query))
+            taken.add(vid)
+            break
+    return picks
+
+
+def run_command(yt: Any, playlist_id: str, max_videos: int, strict: bool) -> None:
+    print("✅ Authenticated channel:", get_channel_title(yt))
+    print("📌 Target PLAYLIST_ID:", playlist_id)
+
+    existing = get_existing_video_ids(yt, playlist_id)
+    print(f"📚 Playlist currently contains {len(existing)} videos")
+
+    added = 0
+    attempts = 0
+    picked_this_run: Set[str] = set()
+    quota_exceeded = False
+    stats = load_query_stats()
+    plan = build_query_plan(stats)
+    via: Dict[str, str] = {}  # picked video -> the query that found it
+
+    while added < max_videos and attempts < MAX_TOTAL_ATTEMPTS and not quota_exceeded:
+        # One query per video still missing, all searched in one round trip;
+        # each query yields at most one pick, so none of them is wasted quota
+        queries = list(islice(plan, min(max_videos - added, MAX_TOTAL_ATTEMPTS - attempts)))
+        if not queries:
+            break
+        attempts += len(queries)
+        for query in queries:
+            stats.setdefault(query, [0, 0])[1] += 1
+
+        queued: List[str] = []
+        for video_id, title, mins, query in pick_new_videos(
+            yt, queries, existing, picked_this_run, strict
+        ):
+            print(f"🎯 Candidate {added+len(queued)+1}/{max_videos}: {title} ({mins} min) — {video_id}")
+            print(f"   via: {query}")
+            via[video_id] = query
+            picked_this_run.add(video_id)
+            queued.append(video_id)
+
+        if not queued:
+            continue
+
+        # The ID set may be days old: confirm against the live playlist
+        for video_id in videos_already_in_playlist(yt, playlist_id, queued):
+            print(f"⚠️ Skipping (already in playlist): {video_id}")
+            remember_added_video(playlist_id, video_id)
+            existing.add(video_id)
+            queued.remove(video_id)
+        if not queued:
+            continue
+
+        errors = insert_videos(yt, playlist_id, queued)
+        for video_id in queued:
+            e = errors.get(video_id)
+            if e is None:
+                remember_added_video(playlist_id, video_id)
+                print(f"✅ Added: {video_id}")
+                stats[via[video_id]][0] += 1
+                added += 1
+                existing.add(video_id)  # so we don't pick it again
+                continue
+
+            kind = _insert_error_kind(e)
+            # Skip known "not usable" cases without failing the workflow
+            if kind == "videoNotFound":
+                print(f"⚠️ Skipping (videoNotFound): {video_id}")
+                continue
+            if kind == "quotaExceeded":
+                quota_exceeded = True
+                continue
+
+            print("❌ YouTube API error while inserting into playlist.")
+            print(e)
+            raise e
+
+        if quota_exceeded:
+            print("⚠️ Quota exceeded. Stopping early for today.")
+
+    save_query_stats(stats)
+    print(f"✅ Done. Added {added}/{max_videos} videos (attempts={attempts}).")
+
+
+# =========================
+# CLI
+# =========================
+
+def main(argv: Optional[List[str]] = None) -> None:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--playlist-id",
+        default=os.getenv("PLAYLIST_ID"),
+        help="target playlist (default: $PLAYLIST_ID)",
+    )
+
+    parser = argparse.ArgumentParser(
+        prog="qpa", description="Curate Quran recitation videos into a YouTube playlist."
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_add = sub.add_parser(
+        "add", parents=[common], help="one topic search; add the best matches"
+    )
+    p_add.add_argument("--max", type=int, default=1, help="videos to add (default: 1)")
+    p_add.add_argument("--filter", choices=["strict", "loose"], default="strict",
+                       help="strict also requires a known reciter in title/channel")
+
+    p_run = sub.add_parser(
+        "run", parents=[common], help="daily run: reciter x topic searches until --max are added"
+    )
+    p_run.add_argument("--max", type=int, default=VIDEOS_PER_RUN,
+                       help=f"videos to add (default: {VIDEOS_PER_RUN})")
+    p_run.add_argument("--filter", choices=["strict", "loose"], default="loose",
+                       help="strict also requires a known reciter in title/channel")
+
+    args = parser.parse_args(argv)
+
+    playlist_id = (args.playlist_id or "").strip()
+    if not playlist_id:
+        parser.error("PLAYLIST_ID env var missing. Set it as a GitHub Secret and pass it in the workflow.")
+
+    yt = load_youtube()
+    strict = args.filter == "strict"
+    try:
+        if args.command == "add":
+            add_command(yt, playlist_id, args.max, strict)
+        else:
+            run_command(yt, playlist_id, args.max, strict)
+    except HttpError as e:
+        print("❌ YouTube API error:", e)
+        raise
@@ -0,0 +1,724 @@
+import hashlib
+import html
+import json
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
+from google.oauth2.credentials import Credentials
+from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp
+import httplib2
+
+try:
+    import orjson
+except ImportError:  # optional; responses are decoded with stdlib json without it
+    orjson = None
+
+# =========================
+# CONFIG
+# =========================
+
+SCOPES = ["https://www.googleapis.com/auth/youtube.force-ssl"]
+
+# Socket timeout for API calls (googleapiclient's default is 60s), so a
+# stalled request fails sooner
+HTTP_TIMEOUT_SECONDS = 30
+# Single read requests retry transient 5xx / rate-limit errors with backoff
+# (googleapiclient never retries quotaExceeded). Inserts are never retried
+# automatically: a failed response doesn't mean the item wasn't added
+API_NUM_RETRIES = 3
+
+# ===== DAILY TARGET =====
+VIDEOS_PER_RUN = 10
+
+# Minimum duration to accept (minutes)
+MIN_DURATION_MINUTES = 15
+
+# Search tuning
+MAX_SEARCH_RESULTS = 25
+SEARCH_RELEVANCE_LANGUAGE = "ar"   # let search ranking favour proper recitations
+SEARCH_REGION_CODE = "SA"
+# Server-side length filter: "long" is > 20 min, so nearly every hit already
+# passes MIN_DURATION_MINUTES before its videos.list check
+SEARCH_VIDEO_DURATION = "long"
+RUN_MAX_CANDIDATES_TO_CHECK = 60   # run: per search query
+ADD_MAX_CANDIDATES_TO_CHECK = 30   # add: per run
+MAX_TOTAL_ATTEMPTS = 40        # overall attempts to find enough videos
+
+# Playlist video IDs are cached between runs (the daily workflow restores
+# this file with actions/cache); full re-scan once the cache is older than this.
+# Picks are confirmed against the live playlist right before inserting, so a
+# stale cache only costs a wasted candidate, never a duplicate
+PLAYLIST_CACHE_FILE = "playlist_cache.json"
+PLAYLIST_CACHE_TTL_SECONDS = 14 * 24 * 3600
+# On expiry only the tail is re-read when the playlist looks append-only; that
+# can't see a removal plus an insert before the tail, so every few expiries
+# every cached page is revalidated instead
+PLAYLIST_TAIL_REFRESHES_PER_FULL_CHECK = 3
+
+# videos.list details are cached the same way: durations never change, and a
+# video that has since gone private just fails its insert and is skipped
+VIDEO_CACHE_FILE = "video_cache.json"
+VIDEO_CACHE_TTL_SECONDS = 30 * 24 * 3600
+
+# The authenticated channel's title, logged at the start of every run; it only
+# changes when token.json is replaced, so it's cached per refresh token
+# (re-checked now and then in case the channel was renamed)
+CHANNEL_CACHE_FILE = "channel_cache.json"
+CHANNEL_CACHE_TTL_SECONDS = 30 * 24 * 3600
+
+# Per-query [hits, tries] across daily runs: run favours reciter x topic
+# combos that have produced videos before
+QUERY_STATS_FILE = "query_stats.json"
+
+# Avoid these words in titles (typical low-quality / shorts / edits);
+# matched as whole words, so "#shorts" is caught too
+BAD_TITLE_WORDS = frozenset({
+    "short", "shorts", "tiktok", "reel", "reels", "edited",
+    "slowed", "meme", "clip", "status",
+})
+
+# Bad-title patterns that need a regex (multi-token / numeric)
+BAD_TITLE_PATTERNS = [
+    r"\bspeed\s*up\b",
+    r"\b1-?11\b",           # catches "1-11" style partial clip titles
+    r"\bpart\s*\d+\b",
+]
+
+# Residual patterns fused into one alternation: one regex pass per title
+_BAD_TITLE_RE = re.compile("|".join(f"(?:{p})" for p in BAD_TITLE_PATTERNS), re.IGNORECASE)
+_WORD_RE = re.compile(r"\w+")
+
+# Reciters used to build search queries
+RECITERS = [
+    # Haramain / Saudi
+    "Abdul Rahman Al-Sudais",
+    "Saud Al-Shuraim",
+    "Maher Al Muaiqly",
+    "Abdullah Awad Al-Juhany",
+    "Yasser Al-Dosari",
+    "Bandar Baleela",
+    # Popular international
+    "Mishary Rashid Alafasy",
+    "Saad Al Ghamdi",
+    "Abdul Basit Abdus Samad",
+    "Mahmoud Khalil Al-Husary",
+    "Mohamed Siddiq El Minshawi",
+    "Mustafa Ismail",
+    "Nasser Al Qatami",
+    "Ahmed Al Ajmi",
+    "Hani Ar-Rifai",
+    "Ali Jaber",
+    # Modern / younger audience
+    "Omar Hisham Al Arabi",
+    "Islam Sobhi",
+    "Hassan Saleh",
+    "Idris Abkar",
+    "Fares Abbad",
+    # Calm / slow style
+    "Salah Bukhatir",
+    "Muhammad Luhaidan",
+    "Abdullah Basfar",
+]
+
+# Extra spellings accepted by the strict reciter filter
+RECITER_ALIASES = [
+    # Saudi / Haramain
+    "Abdurrahman Al Sudais",
+    "Saud Al Shuraim",
+    "Maher Al-Muaiqly",
+    "Yasser Al Dosari",
+    "Abdullah Al-Juhany",
+    "Abdullah Al Juhany",
+    "Saleh Al Talib",
+    "Saleh Al-Talib",
+    "Bandar Balilah",
+    # Popular worldwide
+    "Mishary Alafasy",
+    "Saad Al-Ghamdi",
+    "Abu Bakr Al-Shatri",
+    "Abu Bakr Al Shatri",
+    "Hani Al Rifai",
+    "Muhammad Ayyub",
+    "Mohammed Ayyub",
+    "Sheikh Ali Jaber",
+    "Minshawi",
+    "Al-Minshawi",
+    "Al-Husary",
+    "Abdul Basit",
+    "AbdulBasit",
+]
+
+# Strong partials for spelling variations
+RECITER_PARTIALS = [
+    "sudais", "shuraim", "muaiqly", "dosari", "juhany", "talib",
+    "alafasy", "afasy", "ghamdi", "shatri", "rifai", "ayyub",
+    "ali jaber", "idris abkar", "minshawi", "husary", "abdul basit",
+    "qatami", "basfar", "balilah",
+]
+
+# Topics combined with a reciter name (daily run)
+TOPICS = [
+    # General
+    "quran recitation",
+    "holy quran full recitation",
+    "beautiful quran recitation",
+    "quran tilawat",
+    # Long-form / listening
+    "quran recitation for sleep",
+    "quran recitation for relaxation",
+    "calm quran recitation",
+    "slow quran recitation",
+    # Surah-based
+    "surah al baqarah",
+    "surah al kahf",
+    "surah yasin",
+    "surah ar rahman",
+    "surah al waqiah",
+    "surah maryam",
+    "surah al mulk",
+    "surah al anbiya",
+    # Juz / structured
+    "juz amma recitation",
+    "juz tabarak recitation",
+    # Emotional / spiritual
+    "emotional quran recitation",
+    "beautiful voice quran",
+    "heart touching quran recitation",
+    # Ramadan / night prayers
+    "taraweeh recitation",
+    "qiyam ul layl recitation",
+]
+
+# Topics combined with a reciter name (one-off add)
+SURAH_TOPICS = [
+    "Surah Al-Kahf",
+    "Surah Yasin",
+    "Surah Al-Mulk",
+    "Surah Ar-Rahman",
+    "Surah Al-Baqarah",
+    "Surah Al-Waqiah",
+    "Surah Al-Sajdah",
+    "Juz Amma Quran recitation",
+    "Quran recitation full",
+]
+
+# Optional Arabic keywords to improve “proper recitation” results
+AR_KEYWORDS = ["سورة", "تلاوة", "القرآن", "الشيخ", "قراءة"]
+
+
+def _minimal_needles(needles: List[str]) -> Tuple[str, ...]:
+    """Drop needles that contain a shorter needle; any() over the rest is equivalent."""
+    uniq = set(needles)
+    return tuple(sorted(n for n in uniq if not any(o != n and o in n for o in uniq)))
+
+
+# Every reciter spelling + partial, lowercased once and collapsed into one scan list
+RECITER_NEEDLES = _minimal_needles(
+    [r.lower() for r in RECITERS + RECITER_ALIASES] + RECITER_PARTIALS
+)
+
+# ...and as one alternation, so a match is a single regex pass that stops at the first hit
+_RECITER_RE = re.compile("|".join(map(re.escape, RECITER_NEEDLES)))
+
+
+# =========================
+# Helpers
+# =========================
+
+class _OrjsonModel(JsonModel):
+    """JsonModel that decodes API responses with orjson."""
+
+    def deserialize(self, content: Any) -> Any:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+
+
+def load_youtube() -> Any:
+    """Load token.json and build YouTube client."""
+    if not os.path.exists("token.json"):
+        raise FileNotFoundError(
+            "token.json not found. GitHub Actions must restore it before running this script."
+        )
+
+    creds = Credentials.from_authorized_user_file("token.json", SCOPES)
+    if creds.expired and creds.refresh_token:
+        creds.refresh(Request())
+
+    http = AuthorizedHttp(creds, http=httplib2.Http(timeout=HTTP_TIMEOUT_SECONDS))
+    model = _OrjsonModel() if orjson is not None else None
+    # Use the discovery document bundled with googleapiclient: no HTTP fetch at
+    # startup, and no discovery-cache backend probing either
+    return build(
+        "youtube", "v3", http=http, model=model, static_discovery=True, cache_discovery=False
+    )
+
+
+def get_channel_title(yt: Any) -> str:
+    """Return the authenticated channel's title, from CHANNEL_CACHE_FILE when possible."""
+    refresh_token = getattr(yt._http.credentials, "refresh_token", None) or ""
+    key = hashlib.sha256(refresh_token.encode()).hexdigest()
+    try:
+        with open(CHANNEL_CACHE_FILE, encoding="utf-8") as f:
+            data = json.load(f)
+        if (
+            isinstance(data, dict)
+            and data.get("key") == key
+            and data.get("title")
+            and time.time() - data.get("ts", 0) <= CHANNEL_CACHE_TTL_SECONDS
+        ):
+            return data["title"]
+    except (OSError, ValueError):
+        pass
+
+    me = yt.channels().list(part="snippet", mine=True, fields="items/snippet/title").execute(
+        num_retries=API_NUM_RETRIES
+    )
+    if not me.get("items"):
+        return "UNKNOWN"
+    title = me["items"][0]["snippet"]["title"]
+    with open(CHANNEL_CACHE_FILE, "w", encoding="utf-8") as f:
+        json.dump({"key": key, "ts": time.time(), "title": title}, f)
+    return title
+
+
+def iso8601_to_seconds(duration: str) -> int:
+    """Convert ISO8601 duration like PT1H2M3S to seconds (0 if unparseable)."""
+    if not duration.startswith("PT"):
+        return 0
+    rest = duration[2:]
+    total = 0
+    # Plain string splitting: units must appear in H, M, S order, like the API sends them
+    for unit, mult in (("H", 3600), ("M", 60), ("S", 1)):
+        if unit in rest:
+            n, _, rest = rest.partition(unit)
+            if not n.isdigit():
+                return 0
+            total += int(n) * mult
+    return 0 if rest else total
+
+
+def is_bad_title(title: str) -> bool:
+    if not BAD_TITLE_WORDS.isdisjoint(_WORD_RE.findall(title.lower())):
+        return True
+    return _BAD_TITLE_RE.search(title) is not None
+
+
+def reciter_matches(title: str, channel_title: str) -> bool:
+    return _RECITER_RE.search(f"{title} {channel_title}".lower()) is not None
+
+
+def snippet_is_good(title: str, channel_title: str, strict: bool = True) -> bool:
+    """Title (and, if strict, reciter) filters; cheap enough to run on raw search hits."""
+    if not title:
+        return False
+    if is_bad_title(title):
+        return False
+    return not strict or reciter_matches(title, channel_title)
+
+
+def is_good_video(video: Dict[str, Any]) -> bool:
+    """Check a videos.list item; its title was already vetted from the search snippet."""
+    cd = video.get("contentDetails", {}) or {}
+    status = video.get("status", {}) or {}
+
+    duration = cd.get("duration", "PT0S") or "PT0S"
+
+    if status.get("privacyStatus") == "private":
+        return False
+
+    seconds = iso8601_to_seconds(duration)
+    if seconds < MIN_DURATION_MINUTES * 60:
+        return False
+
+    return True
+
+
+def _read_playlist_cache(playlist_id: str) -> Optional[Dict[str, Any]]:
+    """Return the on-disk cache entry for this playlist, or None."""
+    try:
+        with open(PLAYLIST_CACHE_FILE, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("playlist_id") != playlist_id:
+        return None
+    return data
+
+
+def _write_playlist_cache(
+    playlist_id: str,
+    ids: Set[str],
+    ts: float,
+    pages: Optional[List[Dict[str, Any]]] = None,
+    tail_refreshes: int = 0,
+) -> None:
+    with open(PLAYLIST_CACHE_FILE, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "playlist_id": playlist_id,
+                "ts": ts,
+                "ids": sorted(ids),
+                "pages": pages or [],
+                "tail_refreshes": tail_refreshes,
+            },
+            f,
+        )
+
+
+def remember_added_video(playlist_id: str, video_id: str) -> None:
+    """Record a successful insert in the cache, keeping its original timestamp."""
+    data = _read_playlist_cache(playlist_id)
+    if data is None:
+        return
+    ids = set(data.get("ids", []))
+    ids.add(video_id)
+    _write_playlist_cache(
+        playlist_id, ids, data.get("ts", 0), data.get("pages"), data.get("tail_refreshes", 0)
+    )
+
+
+def _playlist_page_request(
+    yt: Any, playlist_id: str, token: str, cached: Optional[Dict[str, Any]]
+) -> Any:
+    request = yt.playlistItems().list(
+        part="contentDetails",
+        playlistId=playlist_id,
+        maxResults=50,
+        pageToken=token or None,
+        # Keep pageInfo/totalResults: it makes any append change every page's
+        # ETag, so a 304 on an early page can't hide growth further on
+        fields="etag,nextPageToken,pageInfo/totalResults,items/contentDetails/videoId",
+    )
+    if cached is not None and cached.get("etag"):
+        request.headers["If-None-Match"] = cached["etag"]
+    return request
+
+
+def _playlist_page(token: str, resp: Dict[str, Any]) -> Dict[str, Any]:
+    ids = []
+    for item in resp.get("items", []):
+        vid = (item.get("contentDetails") or {}).get("videoId")
+        if vid:
+            ids.append(vid)
+    return {
+        "token": token,
+        "etag": resp.get("etag"),
+        "next": resp.get("nextPageToken"),
+        "total": (resp.get("pageInfo") or {}).get("totalResults"),
+        "ids": ids,
+    }
+
+
+def load_query_stats() -> Dict[str, List[int]]:
+    """Return {query: [hits, tries]} from QUERY_STATS_FILE (empty if missing or unreadable)."""
+    try:
+        with open(QUERY_STATS_FILE, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_query_stats(stats: Dict[str, List[int]]) -> None:
+    with open(QUERY_STATS_FILE, "w", encoding="utf-8") as f:
+        json.dump(stats, f)
+
+
+def _fetch_playlist_page(
+    yt: Any, playlist_id: str, token: str, cached: Optional[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Fetch one playlistItems page as {token, etag, next, total, ids}; a 304 returns the cached page."""
+    try:
+        resp = _playlist_page_request(yt, playlist_id, token, cached).execute(
+            num_retries=API_NUM_RETRIES
+        )
+    except HttpError as e:
+        if e.resp.status != 304 or cached is None:
+            raise
+        return cached
+    return _playlist_page(token, resp)
+
+
+def _revalidate_pages(
+    yt: Any, playlist_id: str, cached: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Re-request every cached page in batches of 50; a 304 keeps the cached copy."""
+    pages: Dict[int, Dict[str, Any]] = {}
+
+    def on_response(request_id: str, response: Dict[str, Any], exception: Exception) -> None:
+        i = int(request_id)
+        if exception is None:
+            pages[i] = _playlist_page(cached[i].get("token") or "", response)
+        elif isinstance(exception, HttpError) and exception.resp.status == 304:
+            pages[i] = cached[i]
+        else:
+            raise exception
+
+    for start in range(0, len(cached), 50):
+        batch = yt.new_batch_http_request(callback=on_response)
+        for i in range(start, min(start + 50, len(cached))):
+            token = cached[i].get("token") or ""
+            batch.add(_playlist_page_request(yt, playlist_id, token, cached[i]), request_id=str(i))
+        batch.execute()
+    return [pages[i] for i in range(len(cached))]
+
+
+def _prefetched_pages(
+    yt: Any, playlist_id: str, cached_pages: Dict[str, Dict[str, Any]], start: str = ""
+) -> Iterator[Dict[str, Any]]:
+    """Yield playlistItems pages from `start` on; page N+1 is in flight while page N is consumed.
+
+    One worker, so only one request is ever in flight and the shared httplib2
+    client is safe.
+    """
+    with ThreadPoolExecutor(max_workers=1) as ex:
+        pending = ex.submit(_fetch_playlist_page, yt, playlist_id, start, cached_pages.get(start))
+        while pending is not None:
+            page = pending.result()
+            token = page.get("next")
+            if token:
+                pending = ex.submit(
+                    _fetch_playlist_page, yt, playlist_id, token, cached_pages.get(token)
+                )
+            else:
+                pending = None
+            yield page
+
+
+def get_existing_video_ids(yt: Any, playlist_id: str) -> Set[str]:
+    """Load all existing video IDs in the playlist once (O(1) duplicate checks)."""
+    cache = _read_playlist_cache(playlist_id)
+    if cache is not None and time.time() - cache.get("ts", 0) <= PLAYLIST_CACHE_TTL_SECONDS:
+        return set(cache.get("ids", []))
+
+    # Expired cache: pages are revalidated with their own ETags, so unchanged
+    # ones come back 304 with no body
+    cached = [page for page in (cache or {}).get("pages", []) if isinstance(page, dict)]
+    cached_pages = {page.get("token") or "": page for page in cached}
+
+    pages: List[Dict[str, Any]] = []
+    tail_refreshes = (cache or {}).get("tail_refreshes", 0)
+    if cached and tail_refreshes < PLAYLIST_TAIL_REFRESHES_PER_FULL_CHECK:
+        # Inserts append to the end: re-read from the last known page onward and
+        # keep the earlier pages. Tokens are offsets, so a removal or reorder
+        # before that page shifts its items; that, or an item count that doesn't
+        # add up, means the earlier pages need checking too
+        last = cached[-1]
+        tail = list(_prefetched_pages(yt, playlist_id, cached_pages, last.get("token") or ""))
+        merged = cached[:-1] + tail
+        if (
+            tail[0]["ids"][:len(last["ids"])] == last["ids"]
+            and sum(len(page["ids"]) for page in merged) == tail[-1].get("total")
+        ):
+            pages = merged
+            tail_refreshes += 1
+        else:
+            cached_pages.update((page.get("token") or "", page) for page in tail)
+            cached = [cached_pages[page.get("token") or ""] for page in cached]
+
+    if cached and not pages:
+        # Page tokens are already known for cached pages, so they all go out
+        # in one batched round trip; keep them while they still chain together
+        tail_refreshes = 0
+        for page in _revalidate_pages(yt, playlist_id, cached):
+            if pages and pages[-1].get("next") != (page.get("token") or ""):
+                break
+            pages.append(page)
+
+    # Pages past the known ones (or all of them, without a cache) are paged serially
+    if not pages:
+        pages = list(_prefetched_pages(yt, playlist_id, cached_pages))
+    elif pages[-1].get("next"):
+        pages += _prefetched_pages(yt, playlist_id, cached_pages, pages[-1]["next"])
+    ids = {vid for page in pages for vid in page["ids"]}
+
+    _write_playlist_cache(playlist_id, ids, time.time(), pages, tail_refreshes)
+    return ids
+
+
+def _search_request(yt: Any, query: str) -> Any:
+    return yt.search().list(
+        part="snippet",
+        q=query,
+        type="video",
+        maxResults=MAX_SEARCH_RESULTS,
+        safeSearch="strict",
+        relevanceLanguage=SEARCH_RELEVANCE_LANGUAGE,
+        regionCode=SEARCH_REGION_CODE,
+        videoDuration=SEARCH_VIDEO_DURATION,
+        fields="items(id/videoId,snippet(title,channelTitle))",
+    )
+
+
+def _search_hits(response: Dict[str, Any]) -> List[Tuple[str, str, str]]:
+    out: List[Tuple[str, str, str]] = []
+    for item in response.get("items", []):
+        vid = (item.get("id") or {}).get("videoId")
+        snip = item.get("snippet") or {}
+        if vid:
+            # search.list returns HTML-escaped titles
+            title = html.unescape(snip.get("title", "") or "")
+            channel_title = html.unescape(snip.get("channelTitle", "") or "")
+            out.append((vid, title, channel_title))
+    return out
+
+
+# search.list costs 100 quota units; a query repeated within one run is served from here
+_SEARCH_CACHE: Dict[str, List[Tuple[str, str, str]]] = {}
+
+
+def search_videos(yt: Any, query: str) -> List[Tuple[str, str, str]]:
+    """Run one search; return (video_id, title, channel_title) per hit."""
+    if query not in _SEARCH_CACHE:
+        request = _search_request(yt, query)
+        _SEARCH_CACHE[query] = _search_hits(request.execute(num_retries=API_NUM_RETRIES))
+    return list(_SEARCH_CACHE[query])
+
+
+def search_videos_batch(yt: Any, queries: List[str]) -> List[Tuple[str, str, str]]:
+    """Run several searches in one batched HTTP request; return unique hits in query order."""
+    def on_response(request_id: str, response: Dict[str, Any], exception: Exception) -> None:
+        if exception is not None:
+            raise exception
+        _SEARCH_CACHE[request_id] = _search_hits(response)
+
+    missing = [q for q in dict.fromkeys(queries) if q not in _SEARCH_CACHE]
+    if missing:
+        batch = yt.new_batch_http_request(callback=on_response)
+        for q in missing:
+            batch.add(_search_request(yt, q), request_id=q)
+        batch.execute()
+
+    seen: Set[str] = set()
+    out: List[Tuple[str, str, str]] = []
+    for q in queries:
+        for hit in _SEARCH_CACHE.get(q, []):
+            if hit[0] not in seen:
+                seen.add(hit[0])
+                out.append(hit)
+    return out
+
+
+# Loaded from VIDEO_CACHE_FILE on first use: {video_id: {"ts": ..., "item": ...}}
+_VIDEO_CACHE: Optional[Dict[str, Dict[str, Any]]] = None
+
+
+def _video_cache() -> Dict[str, Dict[str, Any]]:
+    """Return the video details cache, reading it from disk once and dropping stale entries."""
+    global _VIDEO_CACHE
+    if _VIDEO_CACHE is None:
+        try:
+            with open(VIDEO_CACHE_FILE, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        if not isinstance(data, dict):
+            data = {}
+        now = time.time()
+        _VIDEO_CACHE = {
+            vid: entry
+            for vid, entry in data.items()
+            if isinstance(entry, dict) and now - entry.get("ts", 0) <= VIDEO_CACHE_TTL_SECONDS
+        }
+    return _VIDEO_CACHE
+
+
+def fetch_video_details(yt: Any, video_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Fetch duration and privacy status for many IDs (50 per videos.list call).
+
+    IDs already in the on-disk cache cost no request.
+    """
+    cache = _video_cache()
+    details = {vid: cache[vid]["item"] for vid in video_ids if vid in cache}
+    missing = [vid for vid in video_ids if vid not in details]
+
+    now = time.time()
+    for i in range(0, len(missing), 50):
+        resp = yt.videos().list(
+            part="contentDetails,status",
+            id=",".join(missing[i:i + 50]),
+            fields="items(id,contentDetails/duration,status/privacyStatus)",
+        ).execute(num_retries=API_NUM_RETRIES)
+
+        for item in resp.get("items", []):
+            details[item["id"]] = item
+            cache[item["id"]] = {"ts": now, "item": item}
+
+    if missing:
+        with open(VIDEO_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    return details
+
+
+def _insert_request(yt: Any, playlist_id: str, video_id: str) -> Any:
+    return yt.playlistItems().insert(
+        part="snippet",
+        body={
+            "snippet": {
+                "playlistId": playlist_id,
+                "resourceId": {
+                    "kind": "youtube#video",
+                    "videoId": video_id,
+                },
+            }
+        },
+        fields="id",
+    )
+
+
+def add_video_to_playlist(yt: Any, playlist_id: str, video_id: str) -> None:
+    """Insert video into playlist (safe: no chained execute)."""
+    req = _insert_request(yt, playlist_id, video_id)
+    req.execute()
+
+
+def videos_already_in_playlist(yt: Any, playlist_id: str, video_ids: List[str]) -> Set[str]:
+    """Return which video_ids the live playlist holds (one batched request, 1 unit per ID)."""
+    found: Set[str] = set()
+
+    def on_response(request_id: str, response: Dict[str, Any], exception: Exception) -> None:
+        if exception is not None:
+            raise exception
+        if response.get("items"):
+            found.add(request_id)
+
+    batch = yt.new_batch_http_request(callback=on_response)
+    for vid in video_ids:
+        req = yt.playlistItems().list(
+            part="id",
+            playlistId=playlist_id,
+            videoId=vid,
+            maxResults=1,
+            fields="items/id",
+        )
+        batch.add(req, request_id=vid)
+    batch.execute()
+    return found
+
+
+def add_videos_to_playlist(
+    yt: Any, playlist_id: str, video_ids: List[str]
+) -> Dict[str, Optional[HttpError]]:
+    """Insert several videos in one batched HTTP request.
+
+    Returns each video's HttpError, or None if it was inserted.
+    """
+    errors: Dict[str, Optional[HttpError]] = {}
+
+    def on_insert(request_id: str, response: Any, exception: Optional[HttpError]) -> None:
+        errors[request_id] = exception
+
+    batch = yt.new_batch_http_request(callback=on_insert)
+    for vid in video_ids:
+        batch.add(_insert_request(yt, playlist_id, vid), request_id=vid)
+    batch.execute()
+    return errors
@@ -0,0 +1,135 @@
+import hashlib
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+from qpa import core
+
+PLAYLIST_ID = "PL1"
+
+
+class _Request:
+    def __init__(self, playlist: "FakePlaylist", token: str) -> None:
+        self.playlist = playlist
+        self.token = token
+        self.headers = {}
+
+    def execute(self, num_retries: int = 0):
+        return self.playlist.respond(self)
+
+
+class _Batch:
+    def __init__(self, callback) -> None:
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request: _Request, request_id: str) -> None:
+        self.requests.append((request_id, request))
+
+    def execute(self) -> None:
+        for request_id, request in self.requests:
+            try:
+                response, exception = request.execute(), None
+            except HttpError as e:
+                response, exception = None, e
+            self.callback(request_id, response, exception)
+
+
+class FakePlaylist:
+    """playlistItems.list over an in-memory list: offset page tokens, ETags, 304s."""
+
+    def __init__(self, ids) -> None:
+        self.ids = list(ids)
+        self.calls = 0
+
+    def _page(self, offset: int):
+        ids = self.ids[offset:offset + 50]
+        etag = hashlib.sha256(json.dumps([ids, len(self.ids)]).encode()).hexdigest()
+        return ids, etag
+
+    def respond(self, request: _Request):
+        self.calls += 1
+        offset = int(request.token or 0)
+        ids, etag = self._page(offset)
+        if request.headers.get("If-None-Match") == etag:
+            raise HttpError(httplib2.Response({"status": 304}), b"")
+        resp = {
+            "etag": etag,
+            "pageInfo": {"totalResults": len(self.ids)},
+            "items": [{"contentDetails": {"videoId": vid}} for vid in ids],
+        }
+        if offset + 50 < len(self.ids):
+            resp["nextPageToken"] = str(offset + 50)
+        return resp
+
+    # The slice of the client get_existing_video_ids uses
+    def playlistItems(self):
+        return self
+
+    def list(self, pageToken=None, **kwargs):
+        return _Request(self, pageToken or "")
+
+    def new_batch_http_request(self, callback):
+        return _Batch(callback)
+
+
+class ExistingVideoIdsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        cwd = os.getcwd()
+        os.chdir(tmp.name)
+        self.addCleanup(os.chdir, cwd)
+
+        self.now = 0.0
+        patcher = mock.patch.object(core.time, "time", lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.yt = FakePlaylist(f"v{i}" for i in range(162))
+        self.assertEqual(self.refresh(), set(self.yt.ids))
+
+    def refresh(self):
+        """Expire the cache and reload the IDs."""
+        self.now += core.PLAYLIST_CACHE_TTL_SECONDS + 1
+        return core.get_existing_video_ids(self.yt, PLAYLIST_ID)
+
+    def assertHeals(self) -> None:
+        for _ in range(core.PLAYLIST_TAIL_REFRESHES_PER_FULL_CHECK + 1):
+            self.assertEqual(self.refresh(), set(self.yt.ids))
+
+    def test_append_reads_only_the_tail(self) -> None:
+        self.yt.ids += ["new1", "new2"]
+        self.yt.calls = 0
+        self.assertEqual(self.refresh(), set(self.yt.ids))
+        self.assertEqual(self.yt.calls, 1)
+
+    def test_mid_playlist_removal(self) -> None:
+        self.yt.ids.remove("v10")
+        self.assertHeals()
+
+    def test_removal_plus_append(self) -> None:
+        self.yt.ids.remove("v10")
+        self.yt.ids.append("new1")
+        self.assertHeals()
+
+    def test_last_item_moved_to_front(self) -> None:
+        self.yt.ids.insert(0, self.yt.ids.pop())
+        self.assertHeals()
+
+    def test_reorder_before_the_tail(self) -> None:
+        # Same count and an unchanged last page: only the periodic full check sees it
+        self.yt.ids.remove("v10")
+        self.yt.ids.insert(20, "new1")
+        for _ in range(core.PLAYLIST_TAIL_REFRESHES_PER_FULL_CHECK):
+            self.refresh()
+        self.assertEqual(self.refresh(), set(self.yt.ids))
+
+
+if __name__ == "__main__":
+    unittest.main()